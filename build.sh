@@ -0,0 +1,53 @@
+#!/usr/bin/env bash
+# Build the Lambda deployment zip with precompiled bytecode and a trimmed
+# dependency set, so cold starts skip compiling sources and importing unused
+# files.
+#
+# Usage: ./build.sh
+#
+# PYTHON must match the Lambda runtime version (bytecode is version-specific).
+set -euo pipefail
+
+PYTHON="${PYTHON:-python3}"
+ROOT="$(cd "$(dirname "$0")" && pwd)"
+BUILD_DIR="$ROOT/build/package"
+ZIP_FILE="$ROOT/build/lambda.zip"
+PY_VERSION="$("$PYTHON" -c 'import sys; print(f"{sys.version_info[0]}.{sys.version_info[1]}")')"
+
+# boto3 is provided by the Lambda runtime and bumpver is only a release tool
+RUNTIME_DEPENDENCIES=(
+    "urllib3>=2.0.0"
+    "pandas>=2.2.3"
+    "numpy>=2.2.0"
+    "cachetools>=5.5.0,<6"
+    "orjson>=3.10.0"
+)
+
+rm -rf "$ROOT/build"
+mkdir -p "$BUILD_DIR"
+
+echo "Installing runtime dependencies for Python $PY_VERSION..."
+"$PYTHON" -m pip install --quiet --target "$BUILD_DIR" \
+    --platform manylinux2014_x86_64 --implementation cp --python-version "$PY_VERSION" \
+    --only-binary=:all: "${RUNTIME_DEPENDENCIES[@]}"
+
+cp -r "$ROOT/hvac_settings" "$ROOT/lambda_function.py" "$BUILD_DIR/"
+
+echo "Trimming unused files..."
+find "$BUILD_DIR" -type d \( -name tests -o -name __pycache__ \) -prune -exec rm -rf {} +
+find "$BUILD_DIR" -type d -name '*.dist-info' -prune -exec rm -rf {} +
+# Only UTC is used; the rest of pytz's zoneinfo database is dead weight
+if [ -d "$BUILD_DIR/pytz/zoneinfo" ]; then
+    find "$BUILD_DIR/pytz/zoneinfo" -mindepth 1 -maxdepth 1 ! -name UTC ! -name zone.tab \
+        ! -name zone1970.tab ! -name iso3166.tab ! -name tzdata.zi -exec rm -rf {} +
+fi
+
+echo "Precompiling bytecode..."
+# Legacy (-b) .pyc files sit next to their sources, so the sources can be
+# dropped and Lambda imports the bytecode directly
+"$PYTHON" -m compileall -q -b -j 0 "$BUILD_DIR"
+find "$BUILD_DIR" -name '*.py' -exec sh -c 'test -f "${1}c" && rm "$1"' _ {} \;
+
+echo "Creating $ZIP_FILE..."
+(cd "$BUILD_DIR" && zip -q -r -9 "$ZIP_FILE" .)
+echo "Done: $(du -h "$ZIP_FILE" | cut -f1)"
@@ -2,26 +2,103 @@
 Safety limits module for HVAC settings.
 """
 from hvac_settings.weather import WeatherForecast
+from functools import cached_property
 import math
+import os
+import tempfile
+import time
+import numpy as np
+
+# numba caches compiled kernels next to this module by default, which is
+# read-only on Lambda (/var/task); keep them in the writable temp dir instead
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "numba_cache"))
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below then run as plain Python
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        return lambda func: func
+
+# Rothfusz regression coefficients for the heat index
+HI_C1 = -42.379
+HI_C2 = 2.04901523
+HI_C3 = 10.14333127
+HI_C4 = -0.22475541
+HI_C5 = -6.83783e-3
+HI_C6 = -5.481717e-2
+HI_C7 = 1.22874e-3
+HI_C8 = 8.5282e-4
+HI_C9 = -1.99e-6
+
+LIMITS_CACHE_TTL = 300  # Seconds adjusted limits are reused before refreshing weather data
+
+
+@njit(cache=True)
+def _heat_index_kernel(temperature: float, humidity: float) -> float:
+    """Unrounded Rothfusz heat index; compiled to machine code when numba is installed."""
+    # Rothfusz polynomial grouped by powers of temperature
+    h2 = humidity * humidity
+    return (HI_C1 + HI_C3 * humidity + HI_C6 * h2 +
+            temperature * (HI_C2 + HI_C4 * humidity + HI_C8 * h2) +
+            temperature * temperature * (HI_C5 + HI_C7 * humidity + HI_C9 * h2))
+
+
+@njit(cache=True)
+def _wind_chill_kernel(temperature: float, wind_speed: float) -> float:
+    """Unrounded wind chill; compiled to machine code when numba is installed."""
+    ws16 = wind_speed ** 0.16
+    return 35.74 + (0.6215 * temperature) - (35.75 * ws16) + (0.4275 * temperature * ws16)
+
 
 class SafetyLimits:
     def __init__(self, zip_code: str):
         """
-        Initialize SafetyLimits with zip code to get weather data.
+        Initialize SafetyLimits for a zip code.
+        
+        Weather data is fetched lazily, on first use, so constructing an
+        instance makes no network requests.
         
         Args:
             zip_code (str): US zip code for weather data
-            
+        """
+        self.zip_code = zip_code
+        self._cached_limits = None
+        self._cached_limits_ts = 0.0
+    
+    @cached_property
+    def weather(self) -> WeatherForecast:
+        """
+        WeatherForecast for the zip code, created on first access.
+        
+        Raises:
+            ValueError: If the zip code cannot be geocoded
+        """
+        return WeatherForecast(zip_code=self.zip_code)
+    
+    @cached_property
+    def current_weather(self) -> dict:
+        """
+        Current weather, fetched on first access.
+        
         Raises:
             ValueError: If weather data cannot be retrieved
         """
-        self.weather = WeatherForecast(zip_code=zip_code)
-        self._update_weather_data()
+        return self.weather.get_current_weather()
+    
+    @cached_property
+    def forecast(self) -> dict:
+        """
+        One-hour forecast, fetched on first access.
+        
+        Raises:
+            ValueError: If weather data cannot be retrieved
+        """
+        return self.weather.get_forecast(hours=1)
     
     def _update_weather_data(self) -> None:
-        """Update current weather data."""
-        self.current_weather = self.weather.get_current_weather()
-        self.forecast = self.weather.get_forecast(hours=1)
+        """Update current weather data (served from the WeatherForecast caches while fresh)."""
+        self.current_weather, self.forecast = self.weather.get_current_weather_and_forecast(hours=1)
     
     def _calculate_heat_index(self, temperature: float, humidity: float) -> float:
         """
@@ -34,28 +111,11 @@ class SafetyLimits:
         Returns:
             float: Heat index in Fahrenheit
         """
-        # Constants for heat index calculation
-        c1 = -42.379
-        c2 = 2.04901523
-        c3 = 10.14333127
-        c4 = -0.22475541
-        c5 = -6.83783e-3
-        c6 = -5.481717e-2
-        c7 = 1.22874e-3
-        c8 = 8.5282e-4
-        c9 = -1.99e-6
-        
-        # Calculate heat index
-        hi = (c1 + (c2 * temperature) + (c3 * humidity) + 
-              (c4 * temperature * humidity) + (c5 * temperature**2) + 
-              (c6 * humidity**2) + (c7 * temperature**2 * humidity) + 
-              (c8 * temperature * humidity**2) + (c9 * temperature**2 * humidity**2))
-        
-        # Adjustments for very low and very high temperatures
+        # The regression only applies to hot, humid conditions
         if temperature < 80 or humidity < 40:
-            hi = temperature
+            return round(temperature, 1)
         
-        return round(hi, 1)
+        return round(_heat_index_kernel(float(temperature), float(humidity)), 1)
     
     def _calculate_wind_chill(self, temperature: float, wind_speed: float) -> float:
         """
@@ -70,19 +130,47 @@ class SafetyLimits:
         """
         if temperature > 50 or wind_speed < 3:
             return temperature
+        
+        return round(_wind_chill_kernel(float(temperature), float(wind_speed)), 1)
+    
+    def _calculate_heat_index_array(self, temperatures, humidities) -> np.ndarray:
+        """
+        Calculate heat index for many readings at once using the Rothfusz regression.
+        
+        Args:
+            temperatures (array-like): Temperatures in Fahrenheit
+            humidities (array-like): Relative humidity percentages (None is treated as dry air)
             
-        wc = 35.74 + (0.6215 * temperature) - (35.75 * (wind_speed ** 0.16)) + \
-             (0.4275 * temperature * (wind_speed ** 0.16))
+        Returns:
+            np.ndarray: Heat index in Fahrenheit, rounded to one decimal
+        """
+        temperature = np.asarray(temperatures, dtype=float)
+        humidity = np.asarray(humidities, dtype=float)
         
-        return round(wc, 1)
+        h2 = humidity * humidity
+        hi = (HI_C1 + HI_C3 * humidity + HI_C6 * h2 +
+              temperature * (HI_C2 + HI_C4 * humidity + HI_C8 * h2) +
+              temperature * temperature * (HI_C5 + HI_C7 * humidity + HI_C9 * h2))
+        
+        # The regression only applies to hot, humid conditions
+        heat_index = np.where((temperature >= 80) & (humidity >= 40), hi, temperature)
+        # np.round scales by ten before rounding, which resolves halfway values
+        # such as 88.45 differently from round(); match the scalar path
+        return np.array([round(value, 1) for value in heat_index.tolist()])
     
     def get_adjusted_temperature_limits(self) -> dict:
         """
         Calculate humidity and wind-adjusted temperature limits.
         
+        Limits are reused for LIMITS_CACHE_TTL seconds before the weather data is refreshed.
+        
         Returns:
-            dict: Dictionary containing adjusted temperature limits and current conditions
+            dict: Dictionary containing adjusted temperature limits, current conditions
+                and the heat index for each forecast hour
         """
+        if self._cached_limits is not None and time.monotonic() - self._cached_limits_ts < LIMITS_CACHE_TTL:
+            return self._cached_limits
+        
         self._update_weather_data()
         
         current_temp = self.current_weather["temperature"]
@@ -93,6 +181,13 @@ class SafetyLimits:
         heat_index = self._calculate_heat_index(current_temp, current_humidity)
         wind_chill = self._calculate_wind_chill(current_temp, current_wind)
         
+        # Heat index for every forecast hour in one vectorized pass
+        hourly_forecasts = self.forecast["hourly_forecasts"]
+        forecast_heat_index = self._calculate_heat_index_array(
+            [forecast["temperature"] for forecast in hourly_forecasts],
+            [forecast["humidity"] for forecast in hourly_forecasts]
+        ).tolist()
+        
         # Base safety limits (can be adjusted based on your requirements)
         base_min_temp = 68  # Minimum comfortable temperature
         base_max_temp = 78  # Maximum comfortable temperature
@@ -101,7 +196,7 @@ class SafetyLimits:
         adjusted_min_temp = max(base_min_temp, wind_chill)
         adjusted_max_temp = min(base_max_temp, heat_index)
         
-        return {
+        self._cached_limits = {
             "current_conditions": {
                 "temperature": current_temp,
                 "humidity": current_humidity,
@@ -109,11 +204,22 @@ class SafetyLimits:
                 "heat_index": heat_index,
                 "wind_chill": wind_chill
             },
+            "forecast_conditions": [
+                {
+                    "hour": forecast["hour"],
+                    "temperature": forecast["temperature"],
+                    "humidity": forecast["humidity"],
+                    "heat_index": hi
+                }
+                for forecast, hi in zip(hourly_forecasts, forecast_heat_index)
+            ],
             "adjusted_limits": {
                 "min_temperature": adjusted_min_temp,
                 "max_temperature": adjusted_max_temp
             }
         }
+        self._cached_limits_ts = time.monotonic()
+        return self._cached_limits
     
     def is_safe_temperature(self, temperature: float) -> bool:
         """
@@ -127,6 +233,21 @@ class SafetyLimits:
         """
         limits = self.get_adjusted_temperature_limits()
         return limits["adjusted_limits"]["min_temperature"] <= temperature <= limits["adjusted_limits"]["max_temperature"]
+    
+    def is_safe_temperature_batch(self, temperatures: list) -> list:
+        """
+        Check several temperatures against the same adjusted limits.
+        
+        Args:
+            temperatures (list): Temperatures to check
+            
+        Returns:
+            list: True for each temperature within safe limits, False otherwise
+        """
+        limits = self.get_adjusted_temperature_limits()["adjusted_limits"]
+        min_temp = limits["min_temperature"]
+        max_temp = limits["max_temperature"]
+        return [min_temp <= temperature <= max_temp for temperature in temperatures]
 
 if __name__ == "__main__":
     # Example usage of SafetyLimits class
@@ -153,8 +274,7 @@ if __name__ == "__main__":
         # Check if some example temperatures are safe
         test_temperatures = [65, 72, 80]
         print("\nTemperature Safety Checks:")
-        for temp in test_temperatures:
-            is_safe = safety.is_safe_temperature(temp)
+        for temp, is_safe in zip(test_temperatures, safety.is_safe_temperature_batch(test_temperatures)):
             print(f"{temp}°F is {'safe' if is_safe else 'not safe'}")
             
     except ValueError as e:
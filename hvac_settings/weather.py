@@ -1,15 +1,20 @@
 """
 Weather forecast module for HVAC settings.
 """
-import json
+import math
+import os
+import orjson
 import urllib3
+from urllib.parse import urlsplit
 from urllib3 import Retry
-import time
-import haversine
-from haversine import Unit
-from datetime import datetime, timedelta
-import pytz
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from datetime import datetime, timedelta, timezone
 import pandas as pd
+from hvac_settings import __version__
+from cachetools import LRUCache, TTLCache, cachedmethod
+from cachetools.keys import hashkey
 
 # Constants
 OPEN_STREET_MAP = "https://nominatim.openstreetmap.org/search.php?country=US&postalcode="
@@ -20,13 +25,176 @@ STATION_LATEST = "/observations/latest"
 FORECAST_BASE_URL = "https://api.weather.gov/gridpoints/"
 HOURLY_FORECAST = "/forecast/hourly"
 SUCCESS = 200
-FAHRENHEIT = 9/5
-THIRTY_TWO = 32
-TWO_DEC_PLACES = "%.2f"
-FOUR_DEC_PLACES = "%.4f"
-MILES_PER_HOUR = 1.609
+C_TO_F_MULT = 1.8
+C_TO_F_ADD = 32.0
+TWO_DEC_PLACES = 2
+FOUR_DEC_PLACES = 4
+KMH_TO_MPH = 0.6213711922  # 1 / 1.609344 (international mile)
 RADIUS_LIMIT = 15.00
+EARTH_RADIUS_KM = 6371.0088  # Mean Earth radius (IUGG)
 ERROR_STATUS_CODE = 400
+ZIP_CACHE_SIZE = 4096
+POINTS_CACHE_SIZE = 512
+POINTS_CACHE_TTL = 86400 * 30  # Seconds; NWS grid assignments are effectively static
+POINTS_CACHE_PRECISION = 2  # Decimal places (~1 km), well inside the 2.5 km NWS grid
+STATIONS_CACHE_TTL = 86400  # Seconds; NWS station lists for a location change rarely
+STATION_RANK_PRECISION = 4  # Decimal places (~10 m) for reusing a location's station ranking
+WEATHER_CACHE_SIZE = 256
+CURRENT_WEATHER_CACHE_TTL = 600  # Seconds; most stations report at most hourly
+FORECAST_CACHE_TTL = 3600  # Seconds
+STATION_PROBE_BATCH = 4  # Nearest stations whose observations are fetched concurrently
+
+# Observation properties that must be non-null, in unpacking order, with display names
+REQUIRED_OBSERVATION_FIELDS = {
+    "temperature": "Temperature",
+    "windDirection": "Wind Direction",
+    "windSpeed": "Wind Speed",
+    "relativeHumidity": "Relative Humidity"
+}
+
+_UTC = timezone.utc
+
+# Retry transient failures with exponential backoff rather than hammering NWS,
+# which answers 5xx under load. The final response is returned, not raised, so
+# its status line gets logged.
+_RETRY = Retry(
+    connect=3,
+    status=2,
+    backoff_factor=0.3,
+    status_forcelist=frozenset([500, 502, 503, 504]),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+# NWS responses are large, repetitive JSON; gzip cuts the transfer several-fold
+# and urllib3 decompresses it transparently.
+_HEADERS = {
+    'User-Agent': f'hvac-settings/{__version__}',
+    # NWS serves GeoJSON by default but documents an explicit Accept; plain
+    # JSON covers Nominatim
+    'Accept': 'application/geo+json, application/json',
+    'Accept-Encoding': 'gzip',
+    'Connection': 'keep-alive',
+}
+# Connection pools per (scheme, host), created once and kept for the life of the
+# process so repeated requests (and warm Lambda invocations) reuse keep-alive
+# connections instead of new TLS handshakes.
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+# Optional pre-built table of US zip code centroids shipped alongside this
+# module: little-endian records of (zip, latitude, longitude) sorted by zip,
+# as written by ndarray.tofile(). It is memory-mapped, so only the pages a
+# lookup touches are read; zips found in it skip Nominatim entirely.
+ZIP_CENTROIDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zip_centroids.bin")
+ZIP_CENTROIDS_DTYPE = np.dtype([("zip", "<i4"), ("lat", "<f4"), ("lon", "<f4")])
+
+# Caches shared across WeatherForecast instances. Zip code centroids and NWS
+# grid assignments for a lat/lon never change in practice, so they are kept
+# until evicted; this also keeps repeat zips off Nominatim's 1 req/s limit.
+_ZIP_CACHE = LRUCache(maxsize=ZIP_CACHE_SIZE)
+_POINTS_CACHE = TTLCache(maxsize=POINTS_CACHE_SIZE, ttl=POINTS_CACHE_TTL)
+# Keyed by the observationStations URL, /gridpoints/{office}/{x},{y}/stations,
+# so every location in an NWS grid cell shares one station list
+_STATIONS_CACHE = TTLCache(maxsize=POINTS_CACHE_SIZE, ttl=STATIONS_CACHE_TTL)
+_STATION_RANK_CACHE = TTLCache(maxsize=WEATHER_CACHE_SIZE, ttl=STATIONS_CACHE_TTL)
+# Nearest station of a location, remembered once it reports valid data and
+# then tried on its own first. Farther fallbacks are not remembered, so the
+# nearest station is picked up again as soon as it recovers.
+_VALID_STATION_CACHE = TTLCache(maxsize=WEATHER_CACHE_SIZE, ttl=STATIONS_CACHE_TTL)
+# Weather responses keyed by location (and forecast length) so repeated lookups
+# within the TTL window skip the NWS round trips entirely.
+_CURRENT_WEATHER_CACHE = TTLCache(maxsize=WEATHER_CACHE_SIZE, ttl=CURRENT_WEATHER_CACHE_TTL)
+_FORECAST_CACHE = TTLCache(maxsize=WEATHER_CACHE_SIZE, ttl=FORECAST_CACHE_TTL)
+# Guards the caches above, which may be read and filled from worker threads
+_CACHE_LOCK = threading.Lock()
+_STATION_EXECUTOR = ThreadPoolExecutor(max_workers=STATION_PROBE_BATCH)
+# Runs the current-observation and forecast pipelines side by side
+_PIPELINE_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+def _haversine_km(latitude: float, longitude: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distances in kilometers from one point to arrays of points.
+    
+    Longitudes are signed degrees east, as in GeoJSON [longitude, latitude]
+    coordinates; they must not be folded to absolute values.
+    """
+    # The anchor point is a scalar: convert it once with math rather than
+    # broadcasting NumPy scalar operations through the array expression
+    lat_r = math.radians(latitude)
+    cos_lat_r = math.cos(lat_r)
+    lats_r = np.radians(lats)
+    dlat = lats_r - lat_r
+    dlon = np.radians(lons - longitude)
+    a = np.sin(dlat * 0.5) ** 2 + cos_lat_r * np.cos(lats_r) * np.sin(dlon * 0.5) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _load_zip_centroids(path: str = ZIP_CENTROIDS_FILE):
+    """
+    Memory-map the zip centroid table, or return None if it is not installed.
+    
+    The table only saves geocoding requests, so a truncated or unreadable file
+    is logged and ignored rather than failing the module import.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        size = os.path.getsize(path)
+        if size < ZIP_CENTROIDS_DTYPE.itemsize or size % ZIP_CENTROIDS_DTYPE.itemsize:
+            raise ValueError(f"size {size} is not a whole number of {ZIP_CENTROIDS_DTYPE.itemsize}-byte records")
+        return np.memmap(path, dtype=ZIP_CENTROIDS_DTYPE, mode="r")
+    except (OSError, ValueError) as e:
+        print(f"\nERROR - Ignoring zip centroid table {path}: {str(e)}")
+        return None
+
+
+_ZIP_CENTROIDS = _load_zip_centroids()
+
+
+def _lookup_zip_centroid(zip_code: str):
+    """
+    Look up a zip code in the bundled centroid table.
+    
+    Returns:
+        tuple: (latitude, longitude) rounded to four decimal places, or None if
+            the table is not installed or does not contain the zip code
+    """
+    if _ZIP_CENTROIDS is None or len(zip_code) != 5 or not zip_code.isdigit():
+        return None
+    zips = _ZIP_CENTROIDS["zip"]
+    zip_number = int(zip_code)
+    index = int(np.searchsorted(zips, zip_number))
+    if index == len(zips) or zips[index] != zip_number:
+        return None
+    record = _ZIP_CENTROIDS[index]
+    return (round(float(record["lat"]), FOUR_DEC_PLACES), round(float(record["lon"]), FOUR_DEC_PLACES))
+
+
+def _get_pool(scheme: str, host: str) -> urllib3.HTTPConnectionPool:
+    """Get the shared connection pool for a host, creating it on first use."""
+    pool = _POOLS.get((scheme, host))
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get((scheme, host))
+            if pool is None:
+                pool = urllib3.connection_from_url(
+                    f"{scheme}://{host}", maxsize=8, block=False, retries=_RETRY, headers=_HEADERS
+                )
+                _POOLS[(scheme, host)] = pool
+    return pool
+
+
+def clear_caches() -> None:
+    """Clear the module-level weather metadata and response caches."""
+    _ZIP_CACHE.clear()
+    _POINTS_CACHE.clear()
+    _STATIONS_CACHE.clear()
+    _STATION_RANK_CACHE.clear()
+    _VALID_STATION_CACHE.clear()
+    _CURRENT_WEATHER_CACHE.clear()
+    _FORECAST_CACHE.clear()
+
 
 class WeatherForecast:
     """
@@ -44,8 +212,8 @@ class WeatherForecast:
         Raises:
             ValueError: If neither zip_code nor both latitude and longitude are provided
         """
-        if zip_code:
-            self._get_coordinates_from_zip(zip_code)
+        if zip_code and zip_code.strip():
+            self._get_coordinates_from_zip(zip_code.strip())
         elif latitude is not None and longitude is not None:
             self.latitude = latitude
             self.longitude = longitude
@@ -54,35 +222,54 @@ class WeatherForecast:
         self.grid_id = None
         self.grid_x = None
         self.grid_y = None
+        self.observation_stations_url = None
     
     def _get_coordinates_from_zip(self, zip_code: str) -> None:
         """Get coordinates from zip code using OpenStreetMap."""
+        self.latitude, self.longitude = self._fetch_zip_coordinates(zip_code)
+    
+    @cachedmethod(lambda self: _ZIP_CACHE, lock=lambda self: _CACHE_LOCK)
+    def _fetch_zip_coordinates(self, zip_code: str) -> tuple:
+        """
+        Look up the centroid of a zip code, from the bundled table if present,
+        otherwise using OpenStreetMap.
+        
+        Returns:
+            tuple: (latitude, longitude) rounded to four decimal places
+        """
+        coordinates = _lookup_zip_centroid(zip_code)
+        if coordinates is not None:
+            return coordinates
+        
         zip_code_url = OPEN_STREET_MAP + zip_code + LAT_LON_FORMAT
         coordinates_results = self._get_requests(zip_code_url)
         
         if coordinates_results is None or not coordinates_results:
             raise ValueError(f"Could not get coordinates for zip code {zip_code}")
         
-        self.latitude = float(FOUR_DEC_PLACES % float(coordinates_results[0]["lat"]))
-        self.longitude = float(FOUR_DEC_PLACES % float(coordinates_results[0]["lon"]))
+        return (round(float(coordinates_results[0]["lat"]), FOUR_DEC_PLACES),
+                round(float(coordinates_results[0]["lon"]), FOUR_DEC_PLACES))
     
     def _get_requests(self, url: str) -> dict:
-        """Make HTTP GET request with retries."""
+        """Make HTTP GET request with retries using the host's shared connection pool."""
         data = None
-        retries = Retry(connect=3, status=2)
-        headers = {'User-Agent': 'sampleWeatherAPI.com'}
         try:
-            http = urllib3.PoolManager()
-            response = http.request("GET", url, headers=headers, retries=retries)
-            # print(f"Response status: {response.status}")
-            if response.status == SUCCESS:
-                data = json.loads(response.data)
-                # print(f"Response data: {json.dumps(data, indent=2)}")
-            else:
-                error_info = json.loads(response.data)
-                status_code = error_info.get("status", ERROR_STATUS_CODE)
-                detail = error_info.get("detail", "Unknown error")
-                self._log_error(status_code, str(detail))
+            url_parts = urlsplit(url)
+            path = f"{url_parts.path}?{url_parts.query}" if url_parts.query else url_parts.path
+            # Read the body lazily and hand the connection straight back to the pool
+            response = _get_pool(url_parts.scheme, url_parts.netloc).urlopen(
+                "GET", path, preload_content=False
+            )
+            try:
+                if response.status == SUCCESS:
+                    data = orjson.loads(response.data)
+                else:
+                    # Log the status line only; the error body is discarded
+                    # unread (not decoded or parsed) so the connection can be reused
+                    self._log_error(response.status, response.reason or "HTTP error")
+                    response.drain_conn()
+            finally:
+                response.release_conn()
         except urllib3.exceptions.HTTPError as e:
             self._log_error(ERROR_STATUS_CODE, str(e))
         except Exception as e:
@@ -93,22 +280,71 @@ class WeatherForecast:
         """Log error messages."""
         print(f"\nERROR - Status {status}: {error_message}")
     
-    def _get_grid_coordinates(self) -> None:
-        """Get grid coordinates for the location."""
-        if self.grid_id is not None:
-            return
-            
-        coordinates = f"{self.latitude},{self.longitude}"
+    @cachedmethod(lambda self: _POINTS_CACHE,
+                  key=lambda self, latitude, longitude: hashkey(round(latitude, POINTS_CACHE_PRECISION),
+                                                                round(longitude, POINTS_CACHE_PRECISION)),
+                  lock=lambda self: _CACHE_LOCK)
+    def _fetch_points(self, latitude: float, longitude: float) -> tuple:
+        """
+        Get NWS grid assignment and observation stations URL for a location.
+        
+        Results are shared by all locations that round to the same POINTS_CACHE_PRECISION.
+        
+        Returns:
+            tuple: (grid_id, grid_x, grid_y, observation_stations_url)
+        """
+        # NWS answers coordinates with more than four decimals with a redirect
+        # to the rounded URL, costing an extra round trip
+        coordinates = f"{latitude:.4f},{longitude:.4f}"
         nwc_points_full_url = NWC_POINTS_BASE_URL + coordinates
         metadata = self._get_requests(nwc_points_full_url)
         if metadata is None:
             raise ValueError("Could not get weather metadata")
             
         properties = metadata["properties"]
-        self.grid_id = properties["gridId"]
-        self.grid_x = properties["gridX"]
-        self.grid_y = properties["gridY"]
+        return (properties["gridId"], properties["gridX"], properties["gridY"],
+                properties["observationStations"])
     
+    @cachedmethod(lambda self: _STATIONS_CACHE, lock=lambda self: _CACHE_LOCK)
+    def _fetch_observation_stations(self, observation_url: str) -> tuple:
+        """
+        Get the observation stations listed at the given URL.
+        
+        Only the identifier and coordinates of each station are kept, as
+        parallel sequences, so the cached list is compact and the coordinates
+        can be passed straight to the vectorized distance calculation.
+        
+        Returns:
+            tuple: (station_ids, latitudes, longitudes), with the coordinates
+                as read-only float64 arrays
+        """
+        observation_stations = self._get_requests(observation_url)
+        if observation_stations is None:
+            raise ValueError("Could not get observation stations")
+        features = observation_stations["features"]
+        station_ids = tuple(feature["properties"]["stationIdentifier"] for feature in features)
+        # GeoJSON coordinates are [longitude, latitude]
+        latitudes = np.fromiter((feature["geometry"]["coordinates"][1] for feature in features),
+                                dtype=np.float64, count=len(features))
+        longitudes = np.fromiter((feature["geometry"]["coordinates"][0] for feature in features),
+                                 dtype=np.float64, count=len(features))
+        # The arrays are shared through the cache
+        latitudes.flags.writeable = False
+        longitudes.flags.writeable = False
+        return station_ids, latitudes, longitudes
+    
+    def _get_grid_coordinates(self) -> None:
+        """Get grid coordinates and observation stations URL for the location."""
+        if self.grid_id is not None:
+            return
+            
+        self.grid_id, self.grid_x, self.grid_y, self.observation_stations_url = self._fetch_points(
+            self.latitude, self.longitude
+        )
+    
+    @cachedmethod(lambda self: _FORECAST_CACHE,
+                  key=lambda self, hours=24: hashkey(self.latitude, self.longitude, hours),
+                  lock=lambda self: _CACHE_LOCK)
     def get_forecast(self, hours: int = 24) -> dict:
         """
         Get hourly temperature forecasts for the specified number of hours.
@@ -134,20 +370,28 @@ class WeatherForecast:
             raise ValueError("Could not get forecast data")
             
         periods = forecast_data["properties"]["periods"]
-        current_time = datetime.now(pytz.UTC)
+        current_time = datetime.now(_UTC)
         hourly_forecasts = []
         
-        for period in periods:
-            period_time = datetime.fromisoformat(period["startTime"].replace("Z", "+00:00"))
-            hours_ahead = int((period_time - current_time).total_seconds() / 3600)
+        if periods:
+            # Parse only the start times in one vectorized pass, then build
+            # records for the periods inside the window. NWS returns up to 156
+            # periods, and the fields of the rest are never touched.
+            period_times = pd.to_datetime([period["startTime"] for period in periods], utc=True, format="ISO8601")
+            hours_ahead = ((period_times - current_time) / pd.Timedelta(hours=1)).astype(int)
+            in_window = np.flatnonzero((hours_ahead >= 0) & (hours_ahead < hours))
+            epoch_seconds = (period_times - pd.Timestamp(0, tz=_UTC)) // pd.Timedelta(seconds=1)
             
-            if hours_ahead >= 0 and hours_ahead < hours:
+            for i in in_window:
+                period = periods[i]
+                is_daytime = period.get("isDaytime")
                 hourly_forecasts.append({
-                    "hour": hours_ahead + 1,  # Make hours 1-based instead of 0-based
+                    "hour": int(hours_ahead[i]) + 1,  # Make hours 1-based instead of 0-based
                     "time": period["startTime"],
+                    "time_ts": int(epoch_seconds[i]),
                     "temperature": period["temperature"],
-                    "humidity": period["relativeHumidity"]["value"],
-                    "is_daytime": period.get("isDaytime", True)
+                    "humidity": (period.get("relativeHumidity") or {}).get("value"),
+                    "is_daytime": True if is_daytime is None else is_daytime
                 })
         
         if not hourly_forecasts:
@@ -164,6 +408,9 @@ class WeatherForecast:
             }
         }
     
+    @cachedmethod(lambda self: _CURRENT_WEATHER_CACHE,
+                  key=lambda self: hashkey(self.latitude, self.longitude),
+                  lock=lambda self: _CACHE_LOCK)
     def get_current_weather(self) -> dict:
         """
         Get current weather observation for the specified location.
@@ -175,41 +422,81 @@ class WeatherForecast:
             ValueError: If weather data cannot be retrieved
         """
         coordinates = f"{self.latitude},{self.longitude}"
-        nwc_points_full_url = NWC_POINTS_BASE_URL + coordinates
-        metadata = self._get_requests(nwc_points_full_url)
-        if metadata is None:
-            raise ValueError("Could not get weather metadata")
-            
-        observation_url = metadata["properties"]["observationStations"]
-        observation_stations = self._get_requests(observation_url)
-        if observation_stations is None:
-            raise ValueError("Could not get observation stations")
-            
-        list_of_station_id = observation_stations["features"]
-        current_weather_data = None
+        location_key = hashkey(round(self.latitude, STATION_RANK_PRECISION),
+                               round(self.longitude, STATION_RANK_PRECISION))
         
-        for station in list_of_station_id:
-            station_id = station["properties"]["stationIdentifier"]
-            current_weather_data = self._validate_and_format_weather_data(station_id, coordinates)
-            
+        # The nearest station usually keeps reporting valid data, so once it
+        # has it costs one request instead of a batch
+        with _CACHE_LOCK:
+            last_station_id = _VALID_STATION_CACHE.get(location_key)
+        if last_station_id is not None:
+            current_weather_data = self._validate_and_format_weather_data(last_station_id, coordinates)
             if current_weather_data is not None:
-                obs_coordinates = station["geometry"]["coordinates"]
-                nearby_zip_code_coordinates = (obs_coordinates[1], abs(obs_coordinates[0]))
-                zip_code_coordinates = (self.latitude, abs(self.longitude))
-                actual_distance = haversine.haversine(
-                    nearby_zip_code_coordinates,
-                    zip_code_coordinates,
-                    unit=Unit.KILOMETERS
-                )
-                
-                if actual_distance <= RADIUS_LIMIT:
-                    break
-                current_weather_data = None
+                return current_weather_data
+        
+        self._get_grid_coordinates()
+        ranked_station_ids = self._rank_nearby_stations()
+        nearby_station_ids = [station_id for station_id in ranked_station_ids if station_id != last_station_id]
+        
+        # Probe the nearest stations a batch at a time, concurrently, and keep
+        # the closest one that reports valid data
+        for start in range(0, len(nearby_station_ids), STATION_PROBE_BATCH):
+            station_ids = nearby_station_ids[start:start + STATION_PROBE_BATCH]
+            results = _STATION_EXECUTOR.map(
+                lambda station_id: self._validate_and_format_weather_data(station_id, coordinates),
+                station_ids
+            )
+            for station_id, current_weather_data in zip(station_ids, results):
+                if current_weather_data is not None:
+                    if station_id == ranked_station_ids[0]:
+                        with _CACHE_LOCK:
+                            _VALID_STATION_CACHE[location_key] = station_id
+                    return current_weather_data
         
-        if current_weather_data is None:
-            raise ValueError("Could not get valid weather data")
+        raise ValueError("Could not get valid weather data")
+    
+    @cachedmethod(lambda self: _STATION_RANK_CACHE,
+                  key=lambda self: hashkey(self.observation_stations_url,
+                                           round(self.latitude, STATION_RANK_PRECISION),
+                                           round(self.longitude, STATION_RANK_PRECISION)),
+                  lock=lambda self: _CACHE_LOCK)
+    def _rank_nearby_stations(self) -> tuple:
+        """
+        Get the stations within RADIUS_LIMIT of the location, nearest first.
+        
+        The ranking is computed once per location and station list, so later
+        lookups skip the distance calculation over every station in the grid.
+        
+        Returns:
+            tuple: Station identifiers ordered by distance
+        """
+        station_ids, latitudes, longitudes = self._fetch_observation_stations(self.observation_stations_url)
+        
+        distances = _haversine_km(self.latitude, self.longitude, latitudes, longitudes)
+        in_range = np.flatnonzero(distances <= RADIUS_LIMIT)
+        ranked = in_range[np.argsort(distances[in_range], kind="stable")]
+        return tuple(station_ids[i] for i in ranked)
+    
+    def get_current_weather_and_forecast(self, hours: int = 24) -> tuple:
+        """
+        Get current weather and the hourly forecast, fetching both concurrently.
+        
+        The shared grid metadata is resolved once up front, so the total latency
+        is that of the slower pipeline rather than the sum of both.
+        
+        Args:
+            hours (int): Number of hours to forecast (default: 24)
+            
+        Returns:
+            tuple: (current weather dict, forecast dict)
             
-        return current_weather_data
+        Raises:
+            ValueError: If weather data cannot be retrieved or hours is invalid
+        """
+        self._get_grid_coordinates()
+        current_weather = _PIPELINE_EXECUTOR.submit(self.get_current_weather)
+        forecast = _PIPELINE_EXECUTOR.submit(self.get_forecast, hours=hours)
+        return current_weather.result(), forecast.result()
     
     def _validate_and_format_weather_data(self, station_id: str, zip_code: str) -> dict:
         """Validate and format weather data from a station."""
@@ -219,27 +506,19 @@ class WeatherForecast:
             return None
             
         properties = latest_observation_data["properties"]
+        values = [properties[field]["value"] for field in REQUIRED_OBSERVATION_FIELDS]
+        if None in values:
+            missing = ", ".join(name for name, value in zip(REQUIRED_OBSERVATION_FIELDS.values(), values)
+                                if value is None)
+            self._log_error(ERROR_STATUS_CODE, f"Null fields for {zip_code}: {missing}")
+            return None
+        temperature, wind_direction, wind_speed, relative_humidity = values
         
-        required_fields = {
-            "temperature": "Temperature",
-            "windDirection": "Wind Direction",
-            "windSpeed": "Wind Speed",
-            "relativeHumidity": "Relative Humidity"
-        }
-        
-        for field, name in required_fields.items():
-            if properties[field]["value"] is None:
-                self._log_error(ERROR_STATUS_CODE, f"{name} is null for {zip_code}")
-                return None
-        
-        temperature = (properties["temperature"]["value"] * FAHRENHEIT) + THIRTY_TWO
-        temperature = float(TWO_DEC_PLACES % temperature)
-        wind_speed = float(TWO_DEC_PLACES % (properties["windSpeed"]["value"] / MILES_PER_HOUR))
-        relative_humidity = float(TWO_DEC_PLACES % properties["relativeHumidity"]["value"])
-        wind_direction = properties["windDirection"]["value"]
+        temperature = round(temperature * C_TO_F_MULT + C_TO_F_ADD, TWO_DEC_PLACES)
+        wind_speed = round(wind_speed * KMH_TO_MPH, TWO_DEC_PLACES)
+        relative_humidity = round(float(relative_humidity), TWO_DEC_PLACES)
         
         formatted_data = {
-            "resource_id": int(time.time() * 1000),
             "temperature": temperature,
             "humidity": relative_humidity,
             "wind_speed": wind_speed,
@@ -1,52 +1,88 @@
 """
 AWS Lambda function handler for HVAC weather settings.
 """
-import json
+import os
+from time import time_ns
 import boto3
+import orjson
+from botocore.config import Config
 from hvac_settings.weather import WeatherForecast
 
 # Constants for AWS Lambda
 FUNCTION_NAME = "localtest-internalapi-srv"
 HTTP_STATUS_CODE = 202
+REGION_NAME = "us-east-1"
+ENDPOINT_URL = "https://localhost.localstack.cloud:4566"
+DEFAULT_ZIP_CODE = "15221"
+
+# Created once per container so warm invocations skip loading the service
+# model and resolving credentials
+_LAMBDA_CLIENT = boto3.client(
+    "lambda",
+    region_name=REGION_NAME,
+    endpoint_url=ENDPOINT_URL,
+    aws_access_key_id="test",
+    aws_secret_access_key="test",
+    # Room for concurrent invokes on keep-alive connections, and at most two
+    # retries so a struggling endpoint can't eat the handler's time budget
+    config=Config(max_pool_connections=10, retries={"max_attempts": 2, "mode": "standard"}),
+)
+
+def warm_up() -> None:
+    """
+    Resolve the default zip code and its NWS grid during Lambda init.
+    
+    Init runs with boosted CPU and is not billed against the first request, so
+    paying the geocoding, TLS setup and metadata lookups here speeds up the
+    first invocation. Failures are logged and left for the handler to retry.
+    """
+    try:
+        # Fills the module-level zip and NWS metadata caches in hvac_settings.weather
+        WeatherForecast(zip_code=DEFAULT_ZIP_CODE)._get_grid_coordinates()
+    except Exception as e:
+        # Never let a malformed response abort Lambda init
+        print(f"Warm-up failed: {str(e)}")
+
+# Opt in with INSTANTIATE_ON_IMPORT=1 in the function configuration
+if os.environ.get("INSTANTIATE_ON_IMPORT") == "1":
+    warm_up()
 
 def post_to_timestream(weather_data: dict) -> bool:
     """
     Post weather data to AWS Timestream via Lambda.
     
+    The internal API is invoked asynchronously, so this returns once the
+    invocation is queued rather than waiting for the Timestream write.
+    
     Args:
         weather_data (dict): Weather data to post
         
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if the invocation was accepted, False otherwise
     """
     data = {
         "action": "set",
         "properties": {
             "table": "weather",
             "data": {
-                "resource_id": str(weather_data["resource_id"]),
-                "temperature": float(weather_data["temperature"]),
-                "humidity": float(weather_data["humidity"]),
-                "wind_speed": float(weather_data["wind_speed"]),
+                # Observations are cached, so each record gets its own id
+                # (epoch milliseconds) here rather than with the reading
+                "resource_id": str(time_ns() // 1_000_000),
+                # Already rounded floats from WeatherForecast
+                "temperature": weather_data["temperature"],
+                "humidity": weather_data["humidity"],
+                "wind_speed": weather_data["wind_speed"],
+                # NWS reports whole degrees as integers
                 "wind_direction": float(weather_data["wind_direction"]),
                 "solar": 0.0
             }
         }
     }
     
-    session = boto3.session.Session()
-    lambda_client = session.client(
-        "lambda",
-        "us-east-1",
-        endpoint_url="https://localhost.localstack.cloud:4566",
-        aws_access_key_id="test",
-        aws_secret_access_key="test",
-    )
-    
-    response = lambda_client.invoke(
+    response = _LAMBDA_CLIENT.invoke(
         FunctionName=FUNCTION_NAME,
-        InvocationType="RequestResponse",
-        Payload=json.dumps(data)
+        InvocationType="Event",
+        Payload=orjson.dumps(data)
     )
     
     return response["ResponseMetadata"]["HTTPStatusCode"] == HTTP_STATUS_CODE
@@ -67,23 +103,23 @@ def lambda_handler(event, context):
         if event.get("requestContext", {}).get("http", {}).get("method") == "GET":
             return {
                 'statusCode': 200,
-                'body': json.dumps({
+                'body': orjson.dumps({
                     "expected_payload": {
                         "zip_code": "string (US zip code)"
                     }
-                })
+                }).decode()
             }
         
         # Handle POST requests for weather data
         if event.get("requestContext", {}).get("http", {}).get("method") == "POST":
-            body = json.loads(event.get("body", "{}"))
-            zip_code = body.get("zip_code", "15221")
+            body = orjson.loads(event.get("body", "{}"))
+            zip_code = body.get("zip_code", DEFAULT_ZIP_CODE)
             
-            # Create WeatherForecast instance with zip code
+            # Coordinates and NWS metadata come from the module-level caches on warm invocations
             forecast = WeatherForecast(zip_code=zip_code)
             
-            # Get weather data
-            weather_data = forecast.get_forecast()
+            # Get the current observation
+            weather_data = forecast.get_current_weather()
             
             # Post to Timestream
             success = post_to_timestream(weather_data)
@@ -91,27 +127,27 @@ def lambda_handler(event, context):
             if success:
                 return {
                     'statusCode': 202,
-                    'body': json.dumps("Success! Weather data was posted to timestream!")
+                    'body': orjson.dumps("Success! Weather data was posted to timestream!").decode()
                 }
             else:
                 return {
                     'statusCode': 202,
-                    'body': json.dumps("Error! Could not post to timestream!")
+                    'body': orjson.dumps("Error! Could not post to timestream!").decode()
                 }
         
         # Handle unsupported methods
         return {
             'statusCode': 405,
-            'body': json.dumps("Method not allowed")
+            'body': orjson.dumps("Method not allowed").decode()
         }
             
     except ValueError as e:
         return {
             'statusCode': 400,
-            'body': json.dumps(str(e))
+            'body': orjson.dumps(str(e)).decode()
         }
     except Exception as e:
         return {
             'statusCode': 400,
-            'body': json.dumps(f"An unexpected error occurred: {str(e)}")
+            'body': orjson.dumps(f"An unexpected error occurred: {str(e)}").decode()
         } 
\ No newline at end of file
@@ -1,6 +1,14 @@
 import unittest
 import json
-from lambda_function import lambda_handler
+from unittest.mock import patch
+from lambda_function import lambda_handler, post_to_timestream, warm_up, _LAMBDA_CLIENT
+
+MOCK_WEATHER_DATA = {
+    "temperature": 68.0,
+    "humidity": 65.0,
+    "wind_speed": 6.22,
+    "wind_direction": 180
+}
 
 class TestWeatherLambdaHandler(unittest.TestCase):
     def test_post_with_valid_zip_code(self):
@@ -15,6 +23,37 @@ class TestWeatherLambdaHandler(unittest.TestCase):
         self.assertIsInstance(response["statusCode"], int)
         self.assertIsInstance(response["body"], str)
 
+    @patch("lambda_function._LAMBDA_CLIENT")
+    @patch("lambda_function.WeatherForecast")
+    def test_post_posts_current_weather(self, mock_forecast, lambda_client):
+        mock_forecast.return_value.get_current_weather.return_value = MOCK_WEATHER_DATA
+        lambda_client.invoke.return_value = {"ResponseMetadata": {"HTTPStatusCode": 202}}
+        event = {
+            "requestContext": {"http": {"method": "POST"}},
+            "body": json.dumps({"zip_code": "15221"})
+        }
+        response = lambda_handler(event, None)
+        self.assertEqual(response["statusCode"], 202)
+        self.assertIn("Success", response["body"])
+        mock_forecast.assert_called_once_with(zip_code="15221")
+
+    @patch("lambda_function.time_ns", side_effect=[1700000001000000000, 1700000002000000000])
+    @patch("lambda_function._LAMBDA_CLIENT")
+    @patch("lambda_function.WeatherForecast")
+    def test_repeated_posts_get_fresh_resource_ids(self, mock_forecast, lambda_client, _time_ns):
+        # Both invocations see the same cached observation
+        mock_forecast.return_value.get_current_weather.return_value = MOCK_WEATHER_DATA
+        lambda_client.invoke.return_value = {"ResponseMetadata": {"HTTPStatusCode": 202}}
+        event = {
+            "requestContext": {"http": {"method": "POST"}},
+            "body": json.dumps({"zip_code": "15221"})
+        }
+        lambda_handler(event, None)
+        lambda_handler(event, None)
+        resource_ids = [json.loads(call.kwargs["Payload"])["properties"]["data"]["resource_id"]
+                        for call in lambda_client.invoke.call_args_list]
+        self.assertEqual(resource_ids, ["1700000001000", "1700000002000"])
+
     def test_get_usage_info(self):
         event = {
             "requestContext": {"http": {"method": "GET"}},
@@ -27,5 +66,41 @@ class TestWeatherLambdaHandler(unittest.TestCase):
         self.assertIn("expected_payload", body)
         self.assertIn("zip_code", body["expected_payload"])
 
+    @patch("lambda_function._LAMBDA_CLIENT")
+    def test_post_to_timestream_invokes_asynchronously(self, lambda_client):
+        lambda_client.invoke.return_value = {"ResponseMetadata": {"HTTPStatusCode": 202}}
+        self.assertTrue(post_to_timestream(MOCK_WEATHER_DATA))
+        self.assertEqual(lambda_client.invoke.call_args.kwargs["InvocationType"], "Event")
+
+    @patch("lambda_function.time_ns", return_value=1700000000000000000)
+    @patch("lambda_function._LAMBDA_CLIENT")
+    def test_post_to_timestream_payload(self, lambda_client, _time_ns):
+        lambda_client.invoke.return_value = {"ResponseMetadata": {"HTTPStatusCode": 202}}
+        post_to_timestream(MOCK_WEATHER_DATA)
+        payload = json.loads(lambda_client.invoke.call_args.kwargs["Payload"])
+        data = payload["properties"]["data"]
+        self.assertEqual(data["resource_id"], "1700000000000")
+        self.assertEqual(data["temperature"], 68.0)
+        self.assertEqual(data["wind_speed"], 6.22)
+        self.assertEqual(data["wind_direction"], 180.0)
+
+    def test_lambda_client_config(self):
+        config = _LAMBDA_CLIENT.meta.config
+        self.assertEqual(config.max_pool_connections, 10)
+        self.assertEqual(config.retries["total_max_attempts"], 3)
+
+    @patch("lambda_function.WeatherForecast")
+    def test_warm_up_resolves_default_zip_code(self, mock_forecast):
+        warm_up()
+        mock_forecast.assert_called_once_with(zip_code="15221")
+        mock_forecast.return_value._get_grid_coordinates.assert_called_once()
+
+    @patch("lambda_function.WeatherForecast")
+    def test_warm_up_logs_unexpected_errors(self, mock_forecast):
+        mock_forecast.return_value._get_grid_coordinates.side_effect = KeyError("properties")
+        with patch("builtins.print") as mock_print:
+            warm_up()
+        self.assertIn("Warm-up failed", mock_print.call_args.args[0])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Lightweight stand-ins for urllib3 responses and connection pools.
+"""
+import json
+from dataclasses import dataclass
+
+
+@dataclass
+class FakeResponse:
+    """Minimal urllib3 HTTPResponse with the attributes WeatherForecast reads."""
+    status: int = 200
+    data: bytes = b""
+    reason: str = "OK"
+    drained: bool = False
+    released: bool = False
+
+    def drain_conn(self) -> None:
+        """Record that the unread body was discarded."""
+        self.drained = True
+
+    def release_conn(self) -> None:
+        """Record that the connection was handed back to the pool."""
+        self.released = True
+
+
+def json_response(payload, status: int = 200, reason: str = "OK") -> FakeResponse:
+    """Build a FakeResponse with a JSON-encoded body."""
+    return FakeResponse(status=status, data=json.dumps(payload).encode(), reason=reason)
+
+
+class FakePool:
+    """
+    Connection pool stub that answers requests by path from a lookup table.
+
+    Paths without a registered response get a 404 JSON error, like NWS.
+    """
+    def __init__(self, responses: dict = None):
+        self.responses = {}
+        self.requests = []
+        if responses:
+            self.respond(responses)
+
+    def respond(self, responses: dict) -> None:
+        """Register responses by path; plain payloads are served as 200 JSON."""
+        for path, response in responses.items():
+            if not isinstance(response, FakeResponse):
+                response = json_response(response)
+            self.responses[path] = response
+
+    @property
+    def paths(self) -> list:
+        """Paths requested so far, in order."""
+        return [path for _, path, _ in self.requests]
+
+    def urlopen(self, method: str, path: str, **kwargs) -> FakeResponse:
+        """Return the registered response for a path."""
+        self.requests.append((method, path, kwargs))
+        response = self.responses.get(path)
+        if response is None:
+            response = json_response({"detail": "Not Found"}, status=404, reason="Not Found")
+        return response
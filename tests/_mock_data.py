@@ -0,0 +1,93 @@
+"""
+Mock NWS and OpenStreetMap payloads shared by the test modules.
+
+Kept in a plain module rather than conftest.py so that every importer shares a
+single copy, built once per session.
+"""
+from datetime import datetime, timedelta, timezone
+
+# Mock data
+MOCK_COORDINATES = [{
+    "lat": "40.7128",
+    "lon": "-74.0060"
+}]
+
+MOCK_METADATA = {
+    "properties": {
+        "gridId": "OKX",
+        "gridX": 32,
+        "gridY": 34,
+        "observationStations": "https://api.weather.gov/stations/KNYC"
+    }
+}
+
+MOCK_STATIONS = {
+    "features": [{
+        "properties": {
+            "stationIdentifier": "KNYC"
+        },
+        "geometry": {
+            "coordinates": [-74.0060, 40.7128]
+        }
+    }]
+}
+
+# KNYC sits on the test location; KMID is a few kilometers away
+MOCK_NEARBY_STATIONS = {
+    "features": [
+        {
+            "properties": {"stationIdentifier": "KMID"},
+            "geometry": {"coordinates": [-74.0500, 40.7500]}
+        },
+        {
+            "properties": {"stationIdentifier": "KNYC"},
+            "geometry": {"coordinates": [-74.0060, 40.7128]}
+        }
+    ]
+}
+
+MOCK_WEATHER_DATA = {
+    "properties": {
+        "temperature": {"value": 20.0},
+        "windDirection": {"value": 180},
+        "windSpeed": {"value": 10.0},
+        "relativeHumidity": {"value": 65.0}
+    }
+}
+
+# Create mock hourly forecast data with current time
+current_time = datetime.now(timezone.utc)
+MOCK_HOURLY_FORECAST = {
+    "properties": {
+        "periods": [
+            {
+                "startTime": (current_time + timedelta(hours=1)).isoformat(),
+                "temperature": 72,
+                "windSpeed": "10 mph",
+                "windDirection": "NW",
+                "shortForecast": "Sunny",
+                "detailedForecast": "Sunny with light winds",
+                "relativeHumidity": {"value": 45},
+                "probabilityOfPrecipitation": {"value": 0},
+                "isDaytime": True
+            },
+            {
+                "startTime": (current_time + timedelta(hours=2)).isoformat(),
+                "temperature": 74,
+                "windSpeed": "12 mph",
+                "windDirection": "NW",
+                "shortForecast": "Sunny",
+                "detailedForecast": "Sunny with moderate winds",
+                "relativeHumidity": {"value": 42},
+                "probabilityOfPrecipitation": {"value": 0},
+                "isDaytime": True
+            }
+        ]
+    }
+}
+
+ZIP_PATH = "/search.php?country=US&postalcode=10001&format=jsonv2"
+POINTS_PATH = "/points/40.7128,-74.0060"
+STATIONS_PATH = "/stations/KNYC"
+OBSERVATION_PATH = "/stations/KNYC/observations/latest"
+FORECAST_PATH = "/gridpoints/OKX/32,34/forecast/hourly"
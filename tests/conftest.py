@@ -3,6 +3,24 @@ Pytest configuration file.
 """
 import os
 import sys
+import pytest
 
 # Add the project root directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))) 
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))) 
+
+from hvac_settings.weather import clear_caches  # noqa: E402
+from tests._fakes import FakePool  # noqa: E402
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Clear module-level weather caches between tests."""
+    clear_caches()
+    yield
+    clear_caches()
+
+@pytest.fixture
+def mock_requests(monkeypatch):
+    """Route HTTP requests for every host to a single fake pool."""
+    pool = FakePool()
+    monkeypatch.setattr('hvac_settings.weather._get_pool', lambda scheme, host: pool)
+    return pool
@@ -1,8 +1,10 @@
 """
 Tests for the SafetyLimits class.
 """
+import os
 import pytest
 from unittest.mock import patch, MagicMock
+from hvac_settings import safety as safety_module
 from hvac_settings.safety import SafetyLimits
 
 # Mock weather data
@@ -27,6 +29,7 @@ def mock_weather():
         mock_instance = MagicMock()
         mock_instance.get_current_weather.return_value = MOCK_CURRENT_WEATHER
         mock_instance.get_forecast.return_value = MOCK_FORECAST
+        mock_instance.get_current_weather_and_forecast.return_value = (MOCK_CURRENT_WEATHER, MOCK_FORECAST)
         mock.return_value = mock_instance
         yield mock_instance
 
@@ -34,7 +37,19 @@ def test_initialization(mock_weather):
     """Test SafetyLimits initialization."""
     safety = SafetyLimits(zip_code="94305")
     assert safety.weather is not None
-    mock_weather.get_current_weather.assert_called_once()
+    mock_weather.get_current_weather_and_forecast.assert_not_called()
+    mock_weather.get_current_weather.assert_not_called()
+    mock_weather.get_forecast.assert_not_called()
+
+def test_weather_data_loaded_lazily(mock_weather):
+    """Test that weather data is only fetched when first needed."""
+    safety = SafetyLimits(zip_code="94305")
+    
+    assert safety.current_weather == MOCK_CURRENT_WEATHER
+    mock_weather.get_current_weather.assert_called_once_with()
+    mock_weather.get_forecast.assert_not_called()
+    
+    assert safety.forecast == MOCK_FORECAST
     mock_weather.get_forecast.assert_called_once_with(hours=1)
 
 def test_heat_index_calculation():
@@ -71,6 +86,24 @@ def test_wind_chill_calculation():
     wc = safety._calculate_wind_chill(30, 2)
     assert wc == 30.0
 
+def test_numba_cache_dir_is_writable():
+    """Test that compiled kernels are cached outside the (read-only on Lambda) package directory."""
+    package_dir = os.path.dirname(os.path.abspath(safety_module.__file__))
+    assert not os.environ["NUMBA_CACHE_DIR"].startswith(package_dir)
+    
+def test_heat_index_array_matches_scalar(mock_weather):
+    """Test that the vectorized heat index matches the scalar calculation."""
+    safety = SafetyLimits(zip_code="94305")
+    temperatures = [75, 80, 85, 95, 88.44, 91.7, 75.23, 85.26, 88.45, 75.35]
+    humidities = [60, 60, 30, 70, 62.3, 55.5, 60, 30, 30, 33.61]
+    
+    result = safety._calculate_heat_index_array(temperatures, humidities)
+    expected = [safety._calculate_heat_index(t, h) for t, h in zip(temperatures, humidities)]
+    assert result.tolist() == expected
+    
+    # Unknown humidity falls back to the air temperature
+    assert safety._calculate_heat_index_array([90], [None]).tolist() == [90.0]
+
 def test_get_adjusted_temperature_limits(mock_weather):
     """Test getting adjusted temperature limits."""
     safety = SafetyLimits(zip_code="94305")
@@ -87,6 +120,10 @@ def test_get_adjusted_temperature_limits(mock_weather):
     assert "heat_index" in current
     assert "wind_chill" in current
     
+    forecast_conditions = limits["forecast_conditions"]
+    assert len(forecast_conditions) == len(MOCK_FORECAST["hourly_forecasts"])
+    assert forecast_conditions[0]["heat_index"] == 75.0
+    
     adjusted = limits["adjusted_limits"]
     assert "min_temperature" in adjusted
     assert "max_temperature" in adjusted
@@ -104,4 +141,24 @@ def test_is_safe_temperature(mock_weather):
     # Test temperatures within and outside limits
     assert safety.is_safe_temperature((min_temp + max_temp) / 2)  # Middle of range
     assert not safety.is_safe_temperature(min_temp - 5)  # Below minimum
-    assert not safety.is_safe_temperature(max_temp + 5)  # Above maximum 
\ No newline at end of file
+    assert not safety.is_safe_temperature(max_temp + 5)  # Above maximum
+
+def test_adjusted_limits_cached(mock_weather):
+    """Test that adjusted limits are reused without refetching weather data."""
+    safety = SafetyLimits(zip_code="94305")
+    first = safety.get_adjusted_temperature_limits()
+    assert safety.get_adjusted_temperature_limits() is first
+    safety.is_safe_temperature(72)
+    
+    # Fetched once, when the limits were first computed
+    mock_weather.get_current_weather_and_forecast.assert_called_once_with(hours=1)
+
+def test_is_safe_temperature_batch(mock_weather):
+    """Test checking several temperatures against the same limits."""
+    safety = SafetyLimits(zip_code="94305")
+    limits = safety.get_adjusted_temperature_limits()["adjusted_limits"]
+    min_temp = limits["min_temperature"]
+    max_temp = limits["max_temperature"]
+    
+    results = safety.is_safe_temperature_batch([min_temp - 5, (min_temp + max_temp) / 2, max_temp + 5])
+    assert results == [False, True, False]
@@ -1,87 +1,34 @@
 """
 Tests for the WeatherForecast class.
 """
-import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+import numpy as np
 import pytest
-from hvac_settings.weather import WeatherForecast
-from datetime import datetime, timedelta
-import pytz
-
-# Mock data
-MOCK_COORDINATES = [{
-    "lat": "40.7128",
-    "lon": "-74.0060"
-}]
-
-MOCK_METADATA = {
-    "properties": {
-        "gridId": "OKX",
-        "gridX": 32,
-        "gridY": 34,
-        "observationStations": "https://api.weather.gov/stations/KNYC"
-    }
-}
-
-MOCK_STATIONS = {
-    "features": [{
-        "properties": {
-            "stationIdentifier": "KNYC"
-        },
-        "geometry": {
-            "coordinates": [-74.0060, 40.7128]
-        }
-    }]
-}
-
-MOCK_WEATHER_DATA = {
-    "properties": {
-        "temperature": {"value": 20.0},
-        "windDirection": {"value": 180},
-        "windSpeed": {"value": 10.0},
-        "relativeHumidity": {"value": 65.0}
-    }
-}
+from hvac_settings.weather import (
+    WeatherForecast, ZIP_CENTROIDS_DTYPE, _CURRENT_WEATHER_CACHE, _get_pool, _haversine_km, _load_zip_centroids
+)
+from tests._fakes import FakeResponse, json_response
+from tests._mock_data import (
+    MOCK_COORDINATES, MOCK_METADATA, MOCK_STATIONS, MOCK_NEARBY_STATIONS, MOCK_WEATHER_DATA,
+    MOCK_HOURLY_FORECAST, ZIP_PATH, POINTS_PATH, STATIONS_PATH, OBSERVATION_PATH, FORECAST_PATH
+)
+from datetime import datetime, timedelta, timezone
 
-# Create mock hourly forecast data with current time
-current_time = datetime.now(pytz.UTC)
-MOCK_HOURLY_FORECAST = {
-    "properties": {
-        "periods": [
-            {
-                "startTime": (current_time + timedelta(hours=1)).isoformat(),
-                "temperature": 72,
-                "windSpeed": "10 mph",
-                "windDirection": "NW",
-                "shortForecast": "Sunny",
-                "detailedForecast": "Sunny with light winds",
-                "relativeHumidity": {"value": 45},
-                "probabilityOfPrecipitation": {"value": 0},
-                "isDaytime": True
-            },
-            {
-                "startTime": (current_time + timedelta(hours=2)).isoformat(),
-                "temperature": 74,
-                "windSpeed": "12 mph",
-                "windDirection": "NW",
-                "shortForecast": "Sunny",
-                "detailedForecast": "Sunny with moderate winds",
-                "relativeHumidity": {"value": 42},
-                "probabilityOfPrecipitation": {"value": 0},
-                "isDaytime": True
-            }
-        ]
-    }
-}
+def test_haversine_km_vectorized():
+    """Test vectorized great-circle distances."""
+    distances = _haversine_km(40.7128, -74.0060, np.array([34.0522, 40.7128]), np.array([-118.2437, -74.0060]))
+    assert distances[0] == pytest.approx(3935.75, abs=0.01)  # New York to Los Angeles
+    assert distances[1] == 0.0
 
-@pytest.fixture
-def mock_requests():
-    """Mock HTTP requests."""
-    with patch('urllib3.PoolManager') as mock_pool:
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_pool.return_value.request.return_value = mock_response
-        yield mock_pool
+def test_haversine_km_signed_longitudes():
+    """Test that western, eastern and antimeridian-straddling longitudes are measured correctly."""
+    # Two points on either side of the prime meridian near London
+    distances = _haversine_km(51.5, -0.1, np.array([51.5]), np.array([0.1]))
+    assert distances[0] == pytest.approx(13.85, abs=0.01)
+    
+    # Adak, Alaska area: 179.9°W and 179.9°E are neighbours, not half the globe apart
+    distances = _haversine_km(52.0, -179.9, np.array([52.0]), np.array([179.9]))
+    assert distances[0] == pytest.approx(13.69, abs=0.01)
 
 def test_initialization_with_coordinates():
     """Test initialization with coordinates."""
@@ -91,14 +38,51 @@ def test_initialization_with_coordinates():
 
 def test_initialization_with_zip_code(mock_requests):
     """Test initialization with zip code."""
-    mock_requests.return_value.request.return_value.data = json.dumps(MOCK_COORDINATES).encode()
+    mock_requests.respond({ZIP_PATH: MOCK_COORDINATES})
     forecast = WeatherForecast(zip_code="10001")
     assert forecast.latitude == 40.7128
     assert forecast.longitude == -74.0060
 
+def test_zip_code_coordinates_cached(mock_requests):
+    """Test that repeat zip codes skip the geocoding request."""
+    mock_requests.respond({ZIP_PATH: MOCK_COORDINATES})
+    WeatherForecast(zip_code="10001")
+    forecast = WeatherForecast(zip_code=" 10001 ")
+    assert (forecast.latitude, forecast.longitude) == (40.7128, -74.0060)
+    assert mock_requests.paths == [ZIP_PATH]
+
+def test_zip_code_coordinates_from_centroid_table(mock_requests, monkeypatch, tmp_path):
+    """Test that zip codes in the bundled centroid table skip the geocoding request."""
+    table = np.array([(2139, 42.3647, -71.1042), (10001, 40.7128, -74.0060)], dtype=ZIP_CENTROIDS_DTYPE)
+    table.tofile(tmp_path / "zip_centroids.bin")
+    monkeypatch.setattr('hvac_settings.weather._ZIP_CENTROIDS', _load_zip_centroids(str(tmp_path / "zip_centroids.bin")))
+    mock_requests.respond({"/search.php?country=US&postalcode=15221&format=jsonv2": MOCK_COORDINATES})
+    
+    forecast = WeatherForecast(zip_code="02139")
+    assert (forecast.latitude, forecast.longitude) == (42.3647, -71.1042)
+    forecast = WeatherForecast(zip_code="10001")
+    assert (forecast.latitude, forecast.longitude) == (40.7128, -74.0060)
+    assert mock_requests.paths == []
+    
+    # Zip codes missing from the table fall back to OpenStreetMap
+    WeatherForecast(zip_code="15221")
+    assert mock_requests.paths == ["/search.php?country=US&postalcode=15221&format=jsonv2"]
+
+def test_load_zip_centroids_missing_file(tmp_path):
+    """Test that no table is loaded when the centroid file is not installed."""
+    assert _load_zip_centroids(str(tmp_path / "zip_centroids.bin")) is None
+
+def test_load_zip_centroids_truncated_file(tmp_path, capsys):
+    """Test that a centroid file with a partial record is ignored instead of failing the import."""
+    path = tmp_path / "zip_centroids.bin"
+    path.write_bytes(b"\x00" * (ZIP_CENTROIDS_DTYPE.itemsize + 1))
+    
+    assert _load_zip_centroids(str(path)) is None
+    assert "Ignoring zip centroid table" in capsys.readouterr().out
+
 def test_initialization_with_invalid_zip_code(mock_requests):
     """Test initialization with invalid zip code."""
-    mock_requests.return_value.request.return_value.data = json.dumps([]).encode()
+    mock_requests.respond({"/search.php?country=US&postalcode=99999&format=jsonv2": []})
     with pytest.raises(ValueError, match="Could not get coordinates for zip code 99999"):
         WeatherForecast(zip_code="99999")
 
@@ -109,12 +93,11 @@ def test_initialization_with_no_parameters():
 
 def test_get_current_weather_success(mock_requests):
     """Test successful current weather retrieval."""
-    # Set up mock responses in sequence
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=200, data=json.dumps(MOCK_STATIONS).encode()),
-        MagicMock(status=200, data=json.dumps(MOCK_WEATHER_DATA).encode())
-    ]
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA
+    })
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     weather_data = forecast.get_current_weather()
@@ -124,30 +107,141 @@ def test_get_current_weather_success(mock_requests):
     assert "humidity" in weather_data
     assert "wind_speed" in weather_data
     assert "wind_direction" in weather_data
-    assert "resource_id" in weather_data
+    assert "resource_id" not in weather_data  # Assigned per record when posting
     
     # Verify temperature conversion (C to F)
     assert weather_data["temperature"] == 68.0  # (20.0 * 9/5) + 32
     
     # Verify wind speed conversion (km/h to mph)
-    assert weather_data["wind_speed"] == 6.22  # 10.0 / 1.609
+    assert weather_data["wind_speed"] == 6.21  # 10.0 * 0.6213711922
+
+def test_get_current_weather_probes_nearest_stations(mock_requests):
+    """Test that stations are ranked by distance and far stations are never fetched."""
+    stations = {
+        "features": [
+            {
+                "properties": {"stationIdentifier": "KFAR"},
+                "geometry": {"coordinates": [-75.5000, 41.5000]}
+            },
+            {
+                "properties": {"stationIdentifier": "KMID"},
+                "geometry": {"coordinates": [-74.0500, 40.7500]}
+            },
+            {
+                "properties": {"stationIdentifier": "KNYC"},
+                "geometry": {"coordinates": [-74.0060, 40.7128]}
+            }
+        ]
+    }
+    null_weather = {"properties": dict(MOCK_WEATHER_DATA["properties"], temperature={"value": None})}
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: stations,
+        OBSERVATION_PATH: null_weather,
+        "/stations/KMID/observations/latest": MOCK_WEATHER_DATA
+    })
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    weather_data = forecast.get_current_weather()
+    
+    assert weather_data["temperature"] == 68.0
+    assert "/stations/KFAR/observations/latest" not in mock_requests.paths
+    assert len(mock_requests.paths) == 4
+
+def test_get_current_weather_logs_all_null_fields(mock_requests, capsys):
+    """Test that every null observation field is reported in a single log line."""
+    null_weather = {"properties": dict(MOCK_WEATHER_DATA["properties"],
+                                       temperature={"value": None}, windSpeed={"value": None})}
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, STATIONS_PATH: MOCK_STATIONS, OBSERVATION_PATH: null_weather})
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    with pytest.raises(ValueError, match="Could not get valid weather data"):
+        forecast.get_current_weather()
+    assert "ERROR - Status 400: Null fields for 40.7128,-74.006: Temperature, Wind Speed" in capsys.readouterr().out
+
+def test_get_current_weather_reuses_nearest_valid_station(mock_requests):
+    """Test that the nearest station is probed alone once it has reported valid data."""
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_NEARBY_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA,
+        "/stations/KMID/observations/latest": MOCK_WEATHER_DATA
+    })
+    
+    WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    _CURRENT_WEATHER_CACHE.clear()
+    del mock_requests.requests[:]
+    weather_data = WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    
+    assert weather_data["temperature"] == 68.0
+    assert mock_requests.paths == [OBSERVATION_PATH]
+
+def test_get_current_weather_returns_to_recovered_nearest_station(mock_requests):
+    """Test that a farther fallback station is not remembered over the nearest one."""
+    null_weather = {"properties": dict(MOCK_WEATHER_DATA["properties"], temperature={"value": None})}
+    mid_weather = {"properties": dict(MOCK_WEATHER_DATA["properties"], temperature={"value": 10.0})}
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_NEARBY_STATIONS,
+        OBSERVATION_PATH: null_weather,
+        "/stations/KMID/observations/latest": mid_weather
+    })
+    
+    assert WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()["temperature"] == 50.0
+    _CURRENT_WEATHER_CACHE.clear()
+    mock_requests.respond({OBSERVATION_PATH: MOCK_WEATHER_DATA})
+    del mock_requests.requests[:]
+    weather_data = WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    
+    assert weather_data["temperature"] == 68.0
+    assert OBSERVATION_PATH in mock_requests.paths
+
+def test_observation_stations_kept_compact(mock_requests):
+    """Test that only station identifiers and coordinates are kept from the station list."""
+    mock_requests.respond({STATIONS_PATH: MOCK_STATIONS})
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    station_ids, latitudes, longitudes = forecast._fetch_observation_stations("https://api.weather.gov/stations/KNYC")
+    
+    assert station_ids == ("KNYC",)
+    assert latitudes.tolist() == [40.7128]
+    assert longitudes.tolist() == [-74.0060]
+    assert latitudes.dtype == np.float64
+    assert not latitudes.flags.writeable
+
+def test_station_ranking_cached_by_location(mock_requests):
+    """Test that the nearest-station ranking is computed once per location."""
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, STATIONS_PATH: MOCK_STATIONS})
+    
+    with patch('hvac_settings.weather._haversine_km', wraps=_haversine_km) as mock_haversine:
+        for _ in range(2):
+            forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+            forecast._get_grid_coordinates()
+            assert forecast._rank_nearby_stations() == ("KNYC",)
+    
+    mock_haversine.assert_called_once()
 
 def test_get_current_weather_metadata_failure(mock_requests):
     """Test current weather retrieval with metadata failure."""
-    mock_requests.return_value.request.return_value.status = 404
-    mock_requests.return_value.request.return_value.data = json.dumps({"detail": "Not Found"}).encode()
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    with pytest.raises(ValueError, match="Could not get weather metadata"):
+        forecast.get_current_weather()
+
+def test_get_current_weather_error_body_not_parsed(mock_requests, capsys):
+    """Test that error responses are logged by status line without reading the body."""
+    response = FakeResponse(status=502, data=b"<html>502 Bad Gateway</html>", reason="Bad Gateway")
+    mock_requests.respond({POINTS_PATH: response})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     with pytest.raises(ValueError, match="Could not get weather metadata"):
         forecast.get_current_weather()
+    assert "ERROR - Status 502: Bad Gateway" in capsys.readouterr().out
+    assert response.drained
+    assert response.released
 
 def test_get_current_weather_stations_failure(mock_requests):
     """Test current weather retrieval with stations failure."""
-    # First request succeeds (metadata), second fails (stations)
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=404, data=json.dumps({"detail": "Not Found"}).encode())
-    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     with pytest.raises(ValueError, match="Could not get observation stations"):
@@ -155,20 +249,40 @@ def test_get_current_weather_stations_failure(mock_requests):
 
 def test_get_current_weather_no_valid_data(mock_requests):
     """Test current weather retrieval with no valid station data."""
-    # First two requests succeed (metadata and stations), third fails (weather data)
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=200, data=json.dumps(MOCK_STATIONS).encode()),
-        MagicMock(status=404, data=json.dumps({"detail": "Not Found"}).encode())
-    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, STATIONS_PATH: MOCK_STATIONS})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     with pytest.raises(ValueError, match="Could not get valid weather data"):
         forecast.get_current_weather()
 
+def test_get_pool_reused_per_host():
+    """Test that connection pools are created once per host and reused."""
+    pool = _get_pool("https", "api.weather.gov")
+    assert _get_pool("https", "api.weather.gov") is pool
+    assert _get_pool("https", "nominatim.openstreetmap.org") is not pool
+    assert pool.host == "api.weather.gov"
+    assert pool.retries.backoff_factor > 0
+    assert 503 in pool.retries.status_forcelist
+    assert pool.headers["Accept-Encoding"] == "gzip"
+    assert pool.headers["Accept"].startswith("application/geo+json")
+    assert pool.headers["Connection"] == "keep-alive"
+
+def test_requests_use_host_pool_with_path(mock_requests):
+    """Test that requests are sent through the host's pool using only the path and query."""
+    response = json_response(MOCK_COORDINATES)
+    mock_requests.respond({ZIP_PATH: response})
+    
+    WeatherForecast(zip_code="10001")
+    
+    assert len(mock_requests.requests) == 1
+    method, path, kwargs = mock_requests.requests[0]
+    assert (method, path) == ("GET", ZIP_PATH)
+    assert kwargs["preload_content"] is False
+    assert response.released
+
 def test_get_grid_coordinates(mock_requests):
     """Test getting grid coordinates."""
-    mock_requests.return_value.request.return_value.data = json.dumps(MOCK_METADATA).encode()
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     forecast._get_grid_coordinates()
@@ -176,23 +290,107 @@ def test_get_grid_coordinates(mock_requests):
     assert forecast.grid_id == "OKX"
     assert forecast.grid_x == 32
     assert forecast.grid_y == 34
+    assert forecast.observation_stations_url == "https://api.weather.gov/stations/KNYC"
+
+def test_points_request_uses_four_decimal_coordinates(mock_requests):
+    """Test that /points is requested with coordinates NWS accepts without redirecting."""
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA})
+    
+    WeatherForecast(latitude=40.712812345, longitude=-74.00601)._get_grid_coordinates()
+    
+    assert mock_requests.paths == [POINTS_PATH]
+
+def test_points_metadata_cached_across_instances(mock_requests):
+    """Test that /points metadata is reused by later instances."""
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA
+    })
+    
+    WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    forecast._get_grid_coordinates()
+    
+    assert len(mock_requests.requests) == 3
+    assert forecast.grid_id == "OKX"
+
+def test_points_metadata_cached_for_nearby_coordinates(mock_requests):
+    """Test that coordinates within the cache precision share /points metadata."""
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA})
+    
+    WeatherForecast(latitude=40.7128, longitude=-74.0060)._get_grid_coordinates()
+    nearby = WeatherForecast(latitude=40.7131, longitude=-74.0082)
+    nearby._get_grid_coordinates()
+    
+    assert nearby.grid_id == "OKX"
+    assert mock_requests.paths == [POINTS_PATH]
+
+def test_station_list_shared_within_grid_cell(mock_requests):
+    """Test that locations with separate /points lookups in one grid cell share the station list."""
+    metadata = {"properties": dict(MOCK_METADATA["properties"],
+                                   observationStations="https://api.weather.gov/gridpoints/OKX/32,34/stations")}
+    mock_requests.respond({
+        POINTS_PATH: metadata,
+        "/points/40.7228,-74.0060": metadata,
+        "/gridpoints/OKX/32,34/stations": MOCK_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA
+    })
+    
+    WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    WeatherForecast(latitude=40.7228, longitude=-74.0060).get_current_weather()
+    
+    assert mock_requests.paths.count("/gridpoints/OKX/32,34/stations") == 1
+    assert mock_requests.paths.count("/points/40.7228,-74.0060") == 1
+
+def test_current_weather_cached_by_location(mock_requests):
+    """Test that current weather is served from cache for the same location."""
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA
+    })
+    
+    first = WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    second = WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    
+    assert second == first
+    assert len(mock_requests.requests) == 3
+
+def test_expired_current_weather_only_refetches_observation(mock_requests):
+    """Test that metadata and station lists outlive the observation cache."""
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA
+    })
+    
+    WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    _CURRENT_WEATHER_CACHE.clear()
+    WeatherForecast(latitude=40.7128, longitude=-74.0060).get_current_weather()
+    
+    assert mock_requests.paths == [POINTS_PATH, STATIONS_PATH, OBSERVATION_PATH, OBSERVATION_PATH]
+
+def test_forecast_cached_by_location_and_hours(mock_requests):
+    """Test that forecasts are cached per location and number of hours."""
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, FORECAST_PATH: MOCK_HOURLY_FORECAST})
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    assert len(forecast.get_forecast(hours=2)["hourly_forecasts"]) == 2
+    assert len(forecast.get_forecast(hours=2)["hourly_forecasts"]) == 2
+    assert len(forecast.get_forecast(hours=1)["hourly_forecasts"]) == 1
+    
+    assert mock_requests.paths == [POINTS_PATH, FORECAST_PATH, FORECAST_PATH]
 
 def test_get_grid_coordinates_failure(mock_requests):
     """Test grid coordinates retrieval failure."""
-    mock_requests.return_value.request.return_value.status = 404
-    mock_requests.return_value.request.return_value.data = json.dumps({"detail": "Not Found"}).encode()
-    
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     with pytest.raises(ValueError, match="Could not get weather metadata"):
         forecast._get_grid_coordinates()
 
 def test_get_forecast_hourly_success(mock_requests):
     """Test successful hourly forecast retrieval."""
-    # Mock grid coordinates request
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=200, data=json.dumps(MOCK_HOURLY_FORECAST).encode())
-    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, FORECAST_PATH: MOCK_HOURLY_FORECAST})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     forecast_data = forecast.get_forecast(hours=2)
@@ -220,6 +418,59 @@ def test_get_forecast_hourly_success(mock_requests):
     assert second_hour["humidity"] == 42
     assert second_hour["is_daytime"] is True
 
+def test_get_forecast_hourly_includes_current_period(mock_requests):
+    """Test that the period already in progress counts as hour 1 and past periods are dropped."""
+    now = datetime.now(timezone.utc)
+    periods = [
+        {"startTime": (now - timedelta(hours=2)).isoformat(), "temperature": 60,
+         "relativeHumidity": {"value": 50}, "isDaytime": True},
+        {"startTime": (now - timedelta(minutes=20)).isoformat(), "temperature": 61,
+         "relativeHumidity": {"value": None}, "isDaytime": False},
+        {"startTime": (now + timedelta(minutes=40)).astimezone(timezone(timedelta(hours=-5))).isoformat(),
+         "temperature": 62, "relativeHumidity": {"value": 52}, "isDaytime": False}
+    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, FORECAST_PATH: {"properties": {"periods": periods}}})
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    hourly_forecasts = forecast.get_forecast(hours=1)["hourly_forecasts"]
+    
+    assert [f["temperature"] for f in hourly_forecasts] == [61, 62]
+    assert all(f["hour"] == 1 for f in hourly_forecasts)
+    assert hourly_forecasts[0]["humidity"] is None
+    assert hourly_forecasts[1]["time"] == periods[2]["startTime"]
+
+def test_get_forecast_hourly_reads_only_requested_periods(mock_requests):
+    """Test that periods beyond the requested window are not parsed past their start time."""
+    now = datetime.now(timezone.utc)
+    periods = [
+        {"startTime": (now + timedelta(minutes=30)).isoformat(), "temperature": 70,
+         "relativeHumidity": {"value": 40}, "isDaytime": True},
+        {"startTime": (now + timedelta(minutes=90)).isoformat()}
+    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, FORECAST_PATH: {"properties": {"periods": periods}}})
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    hourly_forecasts = forecast.get_forecast(hours=1)["hourly_forecasts"]
+    
+    assert [f["temperature"] for f in hourly_forecasts] == [70]
+
+def test_get_current_weather_and_forecast(mock_requests):
+    """Test fetching current weather and forecast together after one metadata lookup."""
+    mock_requests.respond({
+        POINTS_PATH: MOCK_METADATA,
+        STATIONS_PATH: MOCK_STATIONS,
+        OBSERVATION_PATH: MOCK_WEATHER_DATA,
+        FORECAST_PATH: MOCK_HOURLY_FORECAST
+    })
+    
+    forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
+    current_weather, forecast_data = forecast.get_current_weather_and_forecast(hours=2)
+    
+    assert current_weather["temperature"] == 68.0
+    assert len(forecast_data["hourly_forecasts"]) == 2
+    assert mock_requests.paths.count(POINTS_PATH) == 1
+    assert len(mock_requests.paths) == 4
+
 def test_get_forecast_hourly_invalid_hours():
     """Test hourly forecast with invalid hours parameter."""
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
@@ -232,11 +483,7 @@ def test_get_forecast_hourly_invalid_hours():
 
 def test_get_forecast_hourly_failure(mock_requests):
     """Test hourly forecast retrieval failure."""
-    # Mock successful grid coordinates request
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=404, data=json.dumps({"detail": "Not Found"}).encode())
-    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     with pytest.raises(ValueError, match="Could not get forecast data"):
@@ -244,11 +491,7 @@ def test_get_forecast_hourly_failure(mock_requests):
 
 def test_get_forecast_hourly_no_data(mock_requests):
     """Test hourly forecast with no forecast data available."""
-    # Mock successful grid coordinates request
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=200, data=json.dumps({"properties": {"periods": []}}).encode())
-    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, FORECAST_PATH: {"properties": {"periods": []}}})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     with pytest.raises(ValueError, match="Could not find forecasts for the next 24 hours"):
@@ -256,11 +499,7 @@ def test_get_forecast_hourly_no_data(mock_requests):
 
 def test_get_forecast_hourly_timezone_handling(mock_requests):
     """Test hourly forecast timezone handling."""
-    # Mock grid coordinates request
-    mock_requests.return_value.request.side_effect = [
-        MagicMock(status=200, data=json.dumps(MOCK_METADATA).encode()),
-        MagicMock(status=200, data=json.dumps(MOCK_HOURLY_FORECAST).encode())
-    ]
+    mock_requests.respond({POINTS_PATH: MOCK_METADATA, FORECAST_PATH: MOCK_HOURLY_FORECAST})
     
     forecast = WeatherForecast(latitude=40.7128, longitude=-74.0060)
     forecast_data = forecast.get_forecast(hours=2)
@@ -272,4 +511,5 @@ def test_get_forecast_hourly_timezone_handling(mock_requests):
     # Verify that forecast times are timezone-aware
     for forecast in forecast_data["hourly_forecasts"]:
         forecast_time = datetime.fromisoformat(forecast["time"].replace("Z", "+00:00"))
-        assert forecast_time.tzinfo is not None 
\ No newline at end of file
+        assert forecast_time.tzinfo is not None
+        assert forecast["time_ts"] == int(forecast_time.timestamp()) 